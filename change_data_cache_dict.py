@@ -33,9 +33,20 @@ pull 和 push 对应 list 的操作，如果使用 push_to_set 接口，那么
 
 '''
 
-import copy
+# 兼容 python2 和 python3，python2 中使用 iteritems 避免生成临时的 list
+try:
+    _iteritems = dict.iteritems
+except AttributeError:
+    _iteritems = dict.items
+
+try:
+    _string_types = basestring
+except NameError:
+    _string_types = str
 
 class ChangeDataCacheListItem(object):
+    __slots__ = ('_parent', '_k', '_data')
+
     def __init__(self, parent, k, data):
         assert isinstance(data, list), 'invalid list type'
 
@@ -43,12 +54,17 @@ class ChangeDataCacheListItem(object):
         self._k = k
         self._data = data
 
+    # @note 返回的是原始数据本身而不是拷贝，用于不需要跟踪修改的只读访问，需要快照的话由调用者自己拷贝
     def data(self):
         return self._data
 
     def __str__(self):
         return str(self._data)
 
+    # @note 封装对象只是数据的视图，pickle 或者 copy 的时候只处理原始数据，不会带上 ChangeDataCache
+    def __reduce__(self):
+        return (list, (self._data,))
+
     def __contains__(self, k):
         return k in self._data
 
@@ -77,10 +93,16 @@ class ChangeDataCacheListItem(object):
         return self._data.pop(index)
 
     def remove(self, k):
-        if k not in self._data:
+        try:
+            index = self._data.index(k)
+        except ValueError:
+            index = None
+
+        # @note 在 except 之外抛出异常，错误信息中不会带上内部的 ValueError
+        if index is None:
             raise ValueError('ChangeDataCacheListItem.remove: value not in list')
 
-        self._data.remove(k)
+        del self._data[index]
         self._notify_dirty()
 
     def count(self, v):
@@ -106,14 +128,18 @@ class ChangeDataCacheListItem(object):
 
     # 扩展的结构，不会raise exception，类似remove，具有返回值说明是否成功
     def pull(self, v):
-        if v not in self._data:
+        try:
+            index = self._data.index(v)
+        except ValueError:
             return False
 
-        self._data.remove(v)
+        del self._data[index]
         self._notify_dirty()
         return True
 
     # 扩展的接口，将list替换为另外一个list
+    # @note 使用切片赋值保持原来list对象不变，原始数据、get_raw 以及缓存的封装对象都引用同一个list，
+    # 如果直接替换对象，这些引用就和内存数据不一致了；直接引用 new_list 的话，外部再修改 new_list 也不会被记录
     def reset_list(self, new_list):
         self._data[:] = new_list
         self._notify_dirty()
@@ -128,9 +154,16 @@ class ChangeDataCacheListItem(object):
 
     # 扩展接口，替换数值
     def replace_value(self, old_value, new_value):
-        return self.replace_at_index(self.index(old_value), new_value) if old_value in self._data else False
+        try:
+            index = self._data.index(old_value)
+        except ValueError:
+            return False
+
+        return self.replace_at_index(index, new_value)
 
 class ChangeDataCacheDictItem(object):
+    __slots__ = ('_parent', '_k', '_data')
+
     def __init__(self, parent, k, data):
         assert isinstance(data, dict), 'invalid dict type'
 
@@ -138,39 +171,46 @@ class ChangeDataCacheDictItem(object):
         self._k = k
         self._data = data
 
+    # @note 返回的是原始数据本身而不是拷贝，用于不需要跟踪修改的只读访问，需要快照的话由调用者自己拷贝
     def data(self):
         return self._data
 
-    def _get_whole_k(self, k):
-        return '%s.%s' % (self._k, k)
-
     def __str__(self):
         return str(self._data)
 
+    # @note 封装对象只是数据的视图，pickle 或者 copy 的时候只处理原始数据，不会带上 ChangeDataCache
+    def __reduce__(self):
+        return (dict, (self._data,))
+
     def __contains__(self, k):
         return k in self._data
 
-    def __getitem__(self, k):
+    def _wrap_value(self, k, v):
         # 如果是字典或者list类型，hook it!
-        v = self._data[k]
+        # @note 每次访问都构造新的封装对象，调用者很少会持有返回的封装对象，缓存封装对象几乎不会命中，反而更慢
         if isinstance(v, list):
-            return ChangeDataCacheListItem(self._parent, self._get_whole_k(k), v)
+            return ChangeDataCacheListItem(self._parent, self._k + (k,), v)
         elif isinstance(v, dict):
-            return ChangeDataCacheDictItem(self._parent, self._get_whole_k(k), v)
+            return ChangeDataCacheDictItem(self._parent, self._k + (k,), v)
         else:
             return v
 
+    def __getitem__(self, k):
+        return self._wrap_value(k, self._data[k])
+
     def __setitem__(self, k, v):
         # 保证进来到_data中的数据都是普通类型数据
-        if isinstance(v, ChangeDataCacheDictItem) or isinstance(v, ChangeDataCacheListItem):
+        # @note 封装类型不会被继承，直接比较类型即可
+        tv = type(v)
+        if tv is ChangeDataCacheDictItem or tv is ChangeDataCacheListItem:
             v = v._data
 
         self._data[k] = v
-        self._parent.update_cache_data(self._get_whole_k(k))
+        self._parent.update_cache_data(self._k + (k,))
 
     def __delitem__(self, k):
         del self._data[k]
-        self._parent.remove_cache_data(self._get_whole_k(k))
+        self._parent.remove_cache_data(self._k + (k,))
 
     def __iter__(self):
         # @note key类型不会是复杂的类型，所以直接返回即可
@@ -180,20 +220,22 @@ class ChangeDataCacheDictItem(object):
         return len(self._data)
 
     def setdefault(self, k, default_value = None):
-        if k not in self._data:
+        data = self._data
+        if k not in data:
             self.__setitem__(k, default_value)
 
-        return self.__getitem__(k)
+        return self._wrap_value(k, data[k])
 
     def has_key(self, k):
         return self.__contains__(k)
 
     # @note 接口和系统的有些区别，如果找不到k，返回None
     def get(self, k, d=None):
-        if k not in self._data:
+        data = self._data
+        if k not in data:
             return d
 
-        return self.__getitem__(k)
+        return self._wrap_value(k, data[k])
 
     # @note 扩展接口，得到原始数据，一般用来在不需要跟踪数据变化的情况下使用
     def get_raw(self, k, d=None):
@@ -201,14 +243,16 @@ class ChangeDataCacheDictItem(object):
 
     # @note 接口和系统的有些区别，如果找不到k，返回None
     def pop(self, k, d=None):
-        if k not in self._data:
+        data = self._data
+        if k not in data:
             return d
 
-        v = self.__getitem__(k)
+        v = self._wrap_value(k, data[k])
         self.__delitem__(k)
         return v
 
     # @note update 比较特殊，只要update，是记录当前层级数据改变，而不是一个个计算子数据的改变，@TODO
+    # 不管修改多少个key，都只会记录一次标记
     def update(self, d):
         self._data.update(d)
         self._parent.update_cache_data(self._k)
@@ -225,7 +269,7 @@ class ChangeDataCacheDictItem(object):
 
         return k, self.pop(k)
 
-    # @note clear 同样，记录当前层级数据 dirty 即可
+    # @note clear 同样，记录当前层级数据 dirty 即可，不管清除了多少个key，都只会记录一次标记
     def clear(self):
         self._data.clear()
         self._parent.update_cache_data(self._k)
@@ -234,90 +278,133 @@ class ChangeDataCacheDictItem(object):
         return self._data.keys()
 
     def iterkeys(self):
-        return self._data.iterkeys()
+        return iter(self._data)
 
+    # @note 直接遍历 iteritems 拿到数据，不需要再通过 __getitem__ 重新查找一次
     def values(self):
-        return [self.__getitem__(k) for k in self._data.iterkeys()]
+        wrap = self._wrap_value
+        return [wrap(k, v) for k, v in _iteritems(self._data)]
 
     def itervalues(self):
-        return (self.__getitem__(k) for k in self._data.iterkeys())
+        wrap = self._wrap_value
+        return (wrap(k, v) for k, v in _iteritems(self._data))
 
     def items(self):
-        return [(k, self.__getitem__(k)) for k in self._data.iterkeys()]
+        wrap = self._wrap_value
+        return [(k, wrap(k, v)) for k, v in _iteritems(self._data)]
 
     def iteritems(self):
-        return ((k, self.__getitem__(k)) for k in self._data.iterkeys())
-
-d = ChangeDataCache({'jiangjinzheng': hangzhou, 'jianglei': shanghai, 'money': 100})
+        wrap = self._wrap_value
+        return ((k, wrap(k, v)) for k, v in _iteritems(self._data))
+
+# @note 标记数据默认是各个层级都是字典的字典类型，叶子节点为 True
+# 将 k_list 的标记从 src 移动到 dst：删除 src 中 k_list 及其子层级的标记，同时在 dst 中记录 k_list 的标记
+# 两个标记数据使用同一次循环逐层向下查找，如果 src 中有更高层级的标记，说明之前操作覆盖了当前操作，返回 False
+def _move_marker(src, dst, k_list, _isinstance=isinstance, _dict=dict):
+    # 记录 src 中向下查找的路径 (parent, k)，删除之后反向清理空的层级
+    path = []
+
+    # d 为 dst 中已经存在的最深层级，depth 为其层数，d_end 表示 dst 已经没有更深的层级
+    d, depth, d_end = dst, 0, False
+    for name in k_list[0:-1]:
+        if src is not None:
+            if name in src:
+                # 到了这里，表示list还没有空，但是data空了，说明要删除的data层级比要更新的层级高，那么删除失败
+                sub = src[name]
+                if not _isinstance(sub, _dict): return False
+
+                path.append((src, name))
+                src = sub
+            else:
+                src = None
 
-# @note data默认是各个层级都是字典的字典类型
-def _delete_dict_recursive(data, k_list):
-    if len(k_list) == 0: return True
-    k = k_list[0]
+        if not d_end:
+            if name in d:
+                d = d[name]
+                depth += 1
 
-    # 最后一个层级，直接删除
-    if len(k_list) == 1:
-        data.pop(k, None)
-        return True
+                # @note 如果中间由一层不是dict，说明之前修改层级高于当前要修改层级，不需要在记录了，因为
+                # 修改层级默认记录最大一层
+                if not _isinstance(d, _dict): d = None; d_end = True
+            else:
+                d_end = True
 
-    # 递归删除
-    if not k in data: return True
+        # 两边都已经没有更深的层级，不需要再继续查找
+        if src is None and d_end: break
 
-    # 到了这里，表示list还没有空，但是data空了，说明要删除的data层级比要更新的层级高，那么删除失败
-    if not isinstance(data[k], dict): return False
-    res = _delete_dict_recursive(data[k], k_list[1:])
+    # 最后一个层级，直接删除，如果删除之后当前层没有了数据，那么删除当前层数据，某一层不为空则上层也不会为空
+    if src is not None:
+        src.pop(k_list[-1], None)
+        for parent, k in reversed(path):
+            if len(parent[k]) != 0: break
+            parent.pop(k)
 
-    # 如果删除之后，当前层没有了数据，那么删除当前层数据
-    if len(data[k]) == 0: data.pop(k)
-    return res
+    # dst 中更高层级的标记已经覆盖了当前 key，不需要再记录
+    if d is None: return True
 
-def _set_dict_recursive(data, k_list, value=True):
-    for name in k_list[0:-1]:
-        # @note 如果中间由一层不是dict，说明到了最后一层，也说明之前修改层级高于当前要修改层级，不需要在记录了，因为
-        # 修改层级默认记录最大一层
-        data = data.setdefault(name, dict())
-        if not isinstance(data, dict): return
+    # dst 中不存在的层级直接新建
+    for name in k_list[depth:-1]:
+        sub = {}
+        d[name] = sub
+        d = sub
 
     # True只是占位符号，表示有修改而已，实际数据在pack时候进行打包封装
-    data[k_list[-1]] = value
-
-# 递归打包update数据，pd为缓存中标记的update数据，od为原始数据，db_dict记录当前入库的数据，db_prefix记录入库数据前缀
-def _pack_update_data_recursive(pd, od, db_dict, db_prefix=''):
-    for k in pd.keys():
-        if k not in od:
-            continue
-
-        new_prefix = db_prefix
-        if new_prefix != '': new_prefix += '.'
-        new_prefix += k
-
-        if pd[k] is True:
-            db_dict[new_prefix] = od[k]
-        else:
-            _pack_update_data_recursive(pd[k], od[k], db_dict, new_prefix)
-
-# 递归打包删除数据
-def _pack_remove_data_recursive(rd, od, db_dict, db_prefix=''):
-    for k in rd.keys():
-        # @note 先计算删除数据的prefix
-        new_prefix = db_prefix
-        if new_prefix != '': new_prefix += '.'
-        new_prefix += k
-
-        # @note 就是需要数据不存在，如果在内存被删除了，那么可能
-        # 1）刚好remove cache数据也是最后一层
-        # 2）用户没有使用指定接口操作，导致不一致。
-        # 但一切按照内存数据为准，如果没有了，那么记录删除
-        if k not in od:
-            db_dict[new_prefix] = True
-            continue
-
-        # 如果出现当前数据被标记删除，但是数据还在，那么也出现数据不一致情况
-        # 直接忽略，因为一切哪找内存数据为准
-        if rd[k] is True:
-            continue
-        else:
-            _pack_remove_data_recursive(rd[k], od[k], db_dict, new_prefix)
+    # @note 如果原来记录的是子层级的标记，直接覆盖，子层级的标记都被当前层级包含了，标记数据只保留最高的层级
+    d[k_list[-1]] = True
+    return True
+
+# 打包标记数据，md为缓存中标记的update或remove数据，od为原始数据，db_dict记录当前入库的数据
+# 使用栈代替递归遍历，栈中记录的前缀已经带上了结尾的点号，输出数据时候只需要拼接一次key
+# @note 标记中记录的是原始的 key，不一定是字符串（比如数字），不能直接拼接的时候使用格式化转换为字符串
+# @note 标记中只记录 True 而不保存修改时候的数据，打包时候和原始数据同步向下遍历取值，以内存数据为准：
+# 重复修改同一个 key 只会标记一次，update_with_no_cache 等接口也会绕过标记直接修改数据，保存的数据可能已经过期
+def _pack_marker_data(md, od, db_dict, is_remove=False):
+    stack = [(md, od, '')]
+    pop, push = stack.pop, stack.append
+    while stack:
+        md, od, prefix = pop()
+        for k, v in _iteritems(md):
+            try:
+                key = prefix + k
+            except TypeError:
+                key = '%s%s' % (prefix, k)
+
+            # @note 删除的数据就是需要数据不存在，如果在内存被删除了，那么可能
+            # 1）刚好remove cache数据也是最后一层
+            # 2）用户没有使用指定接口操作，导致不一致。
+            # 但一切按照内存数据为准，如果没有了，那么记录删除；update数据则直接忽略
+            if k not in od:
+                if is_remove: db_dict[key] = True
+                continue
+
+            if v is True:
+                # 如果出现当前数据被标记删除，但是数据还在，那么也出现数据不一致情况
+                # 直接忽略，因为一切哪找内存数据为准
+                if not is_remove: db_dict[key] = od[k]
+                continue
+
+            push((v, od[k], key + '.'))
+
+# 缓存点号分割 key 得到的 tuple，同样的 key 会被反复使用，缓存数量有上限，超过之后不再缓存
+_split_key_cache = {}
+_SPLIT_KEY_CACHE_SIZE = 4096
+
+def _split_key(k, _cache=_split_key_cache):
+    ''' 'a.b' -> ('a', 'b') '''
+    k_list = _cache.get(k)
+    if k_list is None:
+        k_list = tuple(k.split('.'))
+        if len(_cache) < _SPLIT_KEY_CACHE_SIZE: _cache[k] = k_list
+    return k_list
+
+def _to_key_tuple(k, _tuple=tuple):
+    ''' 'a.b' / ['a', 'b'] / ('a', 'b') -> ('a', 'b') '''
+    if type(k) is not _tuple:
+        k = _split_key(k) if isinstance(k, _string_types) else _tuple(k)
+
+    # @note key 至少要有一个层级，空的 key 没有意义
+    assert len(k) > 0, 'empty key'
+    return k
 
 class ChangeDataCache(object):
     def __init__(self, data):
@@ -327,10 +414,23 @@ class ChangeDataCache(object):
         self.clear_cache()
         self._can_cache = True
 
+    # @note pickle 的时候只保存数据和修改标记，_update_keys 只是加速用的集合，使用的时候重新生成
+    def __getstate__(self):
+        return (self._data, self._update, self._remove, self._can_cache)
+
+    def __setstate__(self, state):
+        self._data, self._update, self._remove, self._can_cache = state
+        self._update_keys = set()
+
     def clear_cache(self):
         self._remove = {}
         self._update = {}
 
+        # 已经被 update 标记覆盖的 key tuple 集合，重复修改同一个 key 的时候不需要再遍历标记数据
+        # @note 只是加速用的集合，只保证其中的 key 一定被 update 标记覆盖；标记被更高层级覆盖的时候不会清理对应的 key，
+        # 所以集合大小和两次打包之间修改过的不同 key 的数量相关，打包或者有删除操作的时候清空
+        self._update_keys = set()
+
     def begin_cache(self):
         self._can_cache = True
 
@@ -343,12 +443,12 @@ class ChangeDataCache(object):
 
         if len(self._remove) > 0:
             remove_db_dict = {}
-            _pack_remove_data_recursive(self._remove, self._data, remove_db_dict)
+            _pack_marker_data(self._remove, self._data, remove_db_dict, is_remove=True)
             res['remove'] = remove_db_dict
 
         if len(self._update) > 0:
             update_db_dict = {}
-            _pack_update_data_recursive(self._update, self._data, update_db_dict)
+            _pack_marker_data(self._update, self._data, update_db_dict)
             res['update'] = update_db_dict
 
         # @note 因为现在逻辑该函数可能被多次调用，如果当前没有数据，clear与否都一样
@@ -357,106 +457,121 @@ class ChangeDataCache(object):
         if clear_cache: self.clear_cache()
         return res
 
-    def _get_before_last_level_data(self, k):
-        ''' a.b -> (self._data[a], b) '''
+    def _get_before_last_level_data(self, k_list):
+        ''' (a, b) -> (self._data[a], b)，如果中间层级不存在或者不是dict，返回 (None, b) '''
         data = self._data
-        k_list = k.split('.')
-        for name in k_list[0:-1]: data = data[name]
+
+        # 第一层级的 key 最常见，不需要再切片遍历
+        if len(k_list) == 1: return (data, k_list[0])
+
+        for name in k_list[0:-1]:
+            data = data.get(name)
+            if not isinstance(data, dict): return (None, k_list[-1])
         return (data, k_list[-1])
 
-    def _get_level_data(self, k):
-        ''' a.b -> self._data[a][b] '''
+    def _get_level_data(self, k_list):
+        ''' (a, b) -> self._data[a][b]，如果层级不存在，返回 None '''
         data = self._data
-        k_list = k.split('.')
-        for name in k_list: data = data[name]
+        for name in k_list:
+            if not isinstance(data, dict): return None
+            data = data.get(name)
         return data
 
     def remove_data(self, k):
-        try:
-            if self._remove_data_impl(k):
-                self.remove_cache_data(k)
-                return True
-            else:
-                return False
-        except Exception, e:
+        # @note k 必须是点号分割的字符串，其他类型直接返回失败
+        if not isinstance(k, _string_types): return False
+        k_list = _split_key(k)
+        if self._remove_data_impl(k_list):
+            self.remove_cache_data(k_list)
+            return True
+        else:
             return False
 
-    def _remove_data_impl(self, k):
-        bld, k_last = self._get_before_last_level_data(k)
-        if k_last not in bld: return False
+    def _remove_data_impl(self, k_list):
+        bld, k_last = self._get_before_last_level_data(k_list)
+        if bld is None or k_last not in bld: return False
 
         bld.pop(k_last)
         return True
 
+    # k 为按层级拆分好的 key tuple，如 ('a', 'b')，也可以是点号分割的字符串 'a.b'
     def remove_cache_data(self, k):
         if not self._can_cache: return
+        k_list = _to_key_tuple(k)
 
-        k_list = k.split('.')
+        # @note 删除可能会去掉任意层级的 update 标记，直接清空集合，删除操作相对于修改要少很多
+        self._update_keys.clear()
 
-        if _delete_dict_recursive(self._update, k_list):
-            _set_dict_recursive(self._remove, k_list)
+        _move_marker(self._update, self._remove, k_list)
 
     def update_data(self, k, v):
-        try:
-            if self._update_data_impl(k, v):
-                self.update_cache_data(k)
-                return True
-            else:
-                return False
-        except Exception, e:
+        # @note k 必须是点号分割的字符串，其他类型直接返回失败
+        if not isinstance(k, _string_types): return False
+        k_list = _split_key(k)
+        if self._update_data_impl(k_list, v):
+            self.update_cache_data(k_list)
+            return True
+        else:
             return False
 
-    def _update_data_impl(self, k, v):
-        if isinstance(v, ChangeDataCacheDictItem) or isinstance(v, ChangeDataCacheListItem):
+    def _update_data_impl(self, k_list, v):
+        # @note 封装类型不会被继承，直接比较类型即可
+        tv = type(v)
+        if tv is ChangeDataCacheDictItem or tv is ChangeDataCacheListItem:
             v = v._data
 
-        bld, k_last = self._get_before_last_level_data(k)
+        bld, k_last = self._get_before_last_level_data(k_list)
+        if bld is None: return False
+
         bld[k_last] = v
         return True
 
+    # k 为按层级拆分好的 key tuple，如 ('a', 'b')，也可以是点号分割的字符串 'a.b'
     def update_cache_data(self, k):
         if not self._can_cache: return
+        k_list = _to_key_tuple(k)
+        if k_list in self._update_keys: return
 
-        k_list = k.split('.')
-
-        # 如果之前删除，后面又更新，则覆盖删除，使用更新数据重新来过
-        if _delete_dict_recursive(self._remove, k_list):
-            # update中记录的是嵌套结构的dict数据结构
-            _set_dict_recursive(self._update, k_list)
+        # 如果之前删除，后面又更新，则覆盖删除，使用更新数据重新来过，update中记录的是嵌套结构的dict数据结构
+        if _move_marker(self._remove, self._update, k_list):
+            self._update_keys.add(k_list)
 
     def pull_data(self, k, v):
-        try:
-            if self._pull_data_impl(k, v):
-
-                # list 只要是修改，统一使用 update 逻辑来记录
-                self.update_cache_data(k)
-                return True
-            else:
-                return False
-
-        except Exception, e:
+        # @note k 必须是点号分割的字符串，其他类型直接返回失败
+        if not isinstance(k, _string_types): return False
+        k_list = _split_key(k)
+        if self._pull_data_impl(k_list, v):
+
+            # list 只要是修改，统一使用 update 逻辑来记录
+            self.update_cache_data(k_list)
+            return True
+        else:
             return False
 
-    def _pull_data_impl(self, k, v):
-        ld = self._get_level_data(k)
+    def _pull_data_impl(self, k_list, v):
+        ld = self._get_level_data(k_list)
         if not isinstance(ld, list): return False
-        if v not in ld: return False
 
-        ld.remove(v)
+        try:
+            index = ld.index(v)
+        except ValueError:
+            return False
+
+        del ld[index]
         return True
 
     def push_data(self, k, v, push_to_set=False):
-        try:
-            if self._push_data_impl(k, v, push_to_set=push_to_set):
-                self.update_cache_data(k)
-                return True
-            else:
-                return False
-        except Exception, e:
+        # @note k 必须是点号分割的字符串，其他类型直接返回失败
+        if not isinstance(k, _string_types): return False
+        k_list = _split_key(k)
+        if self._push_data_impl(k_list, v, push_to_set=push_to_set):
+            self.update_cache_data(k_list)
+            return True
+        else:
             return False
 
-    def _push_data_impl(self, k, v, push_to_set=False):
-        ld = self._get_level_data(k)
+    def _push_data_impl(self, k_list, v, push_to_set=False):
+        ld = self._get_level_data(k_list)
         if not isinstance(ld, list): return False
 
         # @note 只有是push_to_set且数据已经存在的情况下，push失败
@@ -470,17 +585,19 @@ class ChangeDataCache(object):
 
     # @note 这里的k，必须是第一层级的key，即如果k为 'a.b' ，那么认为 'a.b' 就是实际的key，而不是按照点号分割的方式得到嵌套层级数据
     def get_data(self, k):
+        # @note k 不能 hash 的时候（比如 list），直接返回 None
         try:
-            v = self._data[k]
-            if isinstance(v, list):
-                return ChangeDataCacheListItem(self, k, v)
-            elif isinstance(v, dict):
-                return ChangeDataCacheDictItem(self, k, v)
-            else:
-                return v
-        except Exception, e:
+            v = self._data.get(k)
+        except TypeError:
             return None
 
+        if isinstance(v, list):
+            return ChangeDataCacheListItem(self, (k,), v)
+        elif isinstance(v, dict):
+            return ChangeDataCacheDictItem(self, (k,), v)
+        else:
+            return v
+
     # @note 这里的k，必须是第一层级的key，即如果k为 'a.b' ，那么认为 'a.b' 就是实际的key，而不是按照点号分割的方式得到嵌套层级数据
     def set_default_data(self, k, default_value):
         if k not in self._data: